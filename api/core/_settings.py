@@ -0,0 +1,9 @@
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class Settings(BaseSettings):
+    """Minimal config needed by the version contract test."""
+
+    APP_VERSION: str = "0.0.0"
+
+    model_config = SettingsConfigDict(env_file=".env", extra="ignore")
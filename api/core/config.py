@@ -1,20 +1,96 @@
-from pydantic_settings import BaseSettings, SettingsConfigDict
+import os
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import TYPE_CHECKING, cast
 
+if TYPE_CHECKING:
+    from ._settings import Settings
 
-class Settings(BaseSettings):
-    """Minimal config needed by the version contract test."""
+# Opt-in: skip pydantic-settings and read the one field we need straight from
+# the environment / .env. The default path stays on BaseSettings.
+FAST_CONFIG = os.environ.get("STEMSPROUTS_FAST_CONFIG") == "1"
 
-    APP_VERSION: str = "0.0.0"
+_INLINE_COMMENT = re.compile(r"\s+#.*$")
 
-    model_config = SettingsConfigDict(env_file=".env", extra="ignore")
 
+@lru_cache(maxsize=1)
+def _dotenv() -> dict[str, str]:
+    """Parse KEY=VALUE lines from .env, if present, keyed by lower-cased name.
 
-settings = Settings()
+    Covers what this config needs from python-dotenv: blank and `#` lines, an
+    optional `export ` prefix, single/double-quoted values (taken verbatim, no
+    escape processing) and ` # ...` trailing comments on unquoted values.
+    """
+    values: dict[str, str] = {}
+    try:
+        with open(".env", encoding="utf-8") as fh:
+            for line in fh:
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+                if line.startswith("export "):
+                    line = line[len("export "):]
+                key, sep, value = line.partition("=")
+                if not sep:
+                    continue
+                value = value.strip()
+                if value[:1] in ("'", '"') and value[0] in value[1:]:
+                    value = value[1:value.index(value[0], 1)]
+                else:
+                    value = _INLINE_COMMENT.sub("", value)
+                values[key.strip().lower()] = value
+    except FileNotFoundError:
+        pass
+    return values
 
 
-def get_settings() -> Settings:
-    return settings
+def _env(name: str, default: str) -> str:
+    # Matches BaseSettings' defaults: names are case-insensitive and real env
+    # vars win over .env.
+    key = name.lower()
+    for env_key, value in os.environ.items():
+        if env_key.lower() == key:
+            return value
+    return _dotenv().get(key, default)
 
 
-# Convenience alias for modules that want the resolved version directly.
-APP_VERSION = settings.APP_VERSION
\ No newline at end of file
+@lru_cache(maxsize=1)
+def _build_settings_cls() -> "type[Settings]":
+    """Resolve `Settings` on first use so importing this module stays cheap."""
+    if FAST_CONFIG:
+
+        @dataclass(frozen=True, slots=True)
+        class FastSettings:
+            """Dataclass stand-in for the BaseSettings config in `_settings`.
+
+            Only env vars and the subset of .env syntax handled by `_dotenv()`
+            are read; no validation or type coercion.
+            """
+
+            APP_VERSION: str = field(default_factory=lambda: _env("APP_VERSION", "0.0.0"))
+
+        # Same public fields as Settings, which is all callers rely on.
+        return cast("type[Settings]", FastSettings)
+
+    from ._settings import Settings
+
+    return Settings
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> "Settings":
+    return _build_settings_cls()()
+
+
+def __getattr__(name: str):
+    # `Settings`, `settings` and the `APP_VERSION` convenience alias resolve
+    # lazily so that importing this module doesn't pull in pydantic-settings,
+    # read .env or validate the environment.
+    if name == "Settings":
+        return _build_settings_cls()
+    if name == "settings":
+        return get_settings()
+    if name == "APP_VERSION":
+        return get_settings().APP_VERSION
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,73 @@
+import json
+from http import HTTPStatus
+from typing import Any
+
+from fastapi import FastAPI, Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.exceptions import RequestValidationError
+from fastapi.utils import is_body_allowed_for_status_code
+from starlette.exceptions import HTTPException as StarletteHTTPException
+
+# Status code -> envelope `error.code`. Statuses not listed here (e.g. 400,
+# 405) use the generic "HTTP_ERROR" code.
+_CODES = {
+    404: "NOT_FOUND",
+    422: "VALIDATION_ERROR",
+    500: "INTERNAL",
+}
+
+
+def _envelope(code: str, message: str, details: dict[str, Any] | None = None) -> bytes:
+    body = {"error": {"code": code, "message": message, "details": details or {}}}
+    return json.dumps(body, separators=(",", ":")).encode()
+
+
+def _phrase(status_code: int) -> str:
+    try:
+        return HTTPStatus(status_code).phrase
+    except ValueError:
+        return "HTTP Error"
+
+
+# Fixed-shape envelopes are encoded once; only errors carrying their own
+# message or details go through a per-request encode. Responses are still
+# built per request because FastAPI/Starlette may mutate them.
+_NOT_FOUND = _envelope("NOT_FOUND", "Not Found")
+_INTERNAL = _envelope("INTERNAL", "Internal Server Error")
+
+
+# Handlers take `Exception` to match Starlette's handler signature and narrow
+# to the type they are registered for.
+async def http_exception_handler(request: Request, exc: Exception) -> Response:
+    assert isinstance(exc, StarletteHTTPException)
+    # 1xx/204/304 must not carry a body, envelope or otherwise.
+    if not is_body_allowed_for_status_code(exc.status_code):
+        return Response(status_code=exc.status_code, headers=exc.headers)
+    if exc.status_code == 404 and exc.detail == "Not Found" and not exc.headers:
+        return Response(_NOT_FOUND, status_code=404, media_type="application/json")
+    code = _CODES.get(exc.status_code, "HTTP_ERROR")
+    if isinstance(exc.detail, str):
+        body = _envelope(code, exc.detail or _phrase(exc.status_code))
+    else:
+        # Structured details go into `details`, never through str()/repr().
+        body = _envelope(code, _phrase(exc.status_code), {"detail": jsonable_encoder(exc.detail)})
+    return Response(body, status_code=exc.status_code, headers=exc.headers, media_type="application/json")
+
+
+async def validation_exception_handler(request: Request, exc: Exception) -> Response:
+    assert isinstance(exc, RequestValidationError)
+    return Response(
+        _envelope("VALIDATION_ERROR", "Validation Error", {"errors": jsonable_encoder(exc.errors())}),
+        status_code=422,
+        media_type="application/json",
+    )
+
+
+async def unhandled_exception_handler(request: Request, exc: Exception) -> Response:
+    return Response(_INTERNAL, status_code=500, media_type="application/json")
+
+
+def register_exception_handlers(app: FastAPI) -> None:
+    app.add_exception_handler(StarletteHTTPException, http_exception_handler)
+    app.add_exception_handler(RequestValidationError, validation_exception_handler)
+    app.add_exception_handler(Exception, unhandled_exception_handler)
@@ -1,5 +1,13 @@
 from fastapi import FastAPI
+from .core.errors import register_exception_handlers
 from .routers import system
 
-app = FastAPI()
-app.include_router(system.router)
\ No newline at end of file
+
+def create_app() -> FastAPI:
+    app = FastAPI()
+    register_exception_handlers(app)
+    app.include_router(system.router)
+    return app
+
+
+app = create_app()
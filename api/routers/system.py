@@ -1,13 +1,27 @@
-from fastapi import APIRouter
-from api.core.config import settings
+import json
+
+from fastapi import APIRouter, Response
+from api.core.config import get_settings
 
-APP_VERSION = settings.APP_VERSION
 router = APIRouter(prefix="/system")
 
-@router.get("/healthz")
-async def health():
-    return {"ok": True}
+# Both bodies are fixed for the process lifetime, so encode them once here
+# instead of letting FastAPI serialize a fresh dict on every probe.
+_HEALTH = b'{"ok":true}'
+# Resolved at import: clearing the get_settings() cache afterwards does not
+# change what /version reports until the process (or this module) reloads.
+_VERSION = json.dumps({"version": get_settings().APP_VERSION}, separators=(",", ":")).encode()
+
+
+def _constant_handler(body: bytes):
+    # Bind the pre-encoded body in a closure so each request skips the
+    # module-global lookup. The Response itself is built per request because
+    # FastAPI mutates it (e.g. attaching background tasks).
+    async def handler():
+        return Response(body, media_type="application/json")
+
+    return handler
+
 
-@router.get("/version")
-async def get_version():
-    return {"version": APP_VERSION}
\ No newline at end of file
+router.add_api_route("/healthz", _constant_handler(_HEALTH), name="health", response_class=Response)
+router.add_api_route("/version", _constant_handler(_VERSION), name="get_version", response_class=Response)
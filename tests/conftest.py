@@ -0,0 +1,47 @@
+"""Shared fixtures for the backend tests."""
+from __future__ import annotations
+
+import importlib
+import sys
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+
+
+# ------------------------------
+# Repo root resolution (so imports work from tests/)
+# ------------------------------
+
+# Repository root that contains the `api/` package (the tests' parent directory).
+_ROOT = Path(__file__).resolve().parents[1]
+if __debug__:
+    assert (_ROOT / "api").is_dir(), f"expected the api/ package under {_ROOT}"
+_ROOT_STR = str(_ROOT)
+if _ROOT_STR not in sys.path:
+    sys.path.insert(0, _ROOT_STR)
+
+
+# ------------------------------
+# Utilities
+# ------------------------------
+
+def _load_main_app() -> FastAPI:
+    """Import api.main and return its module-level FastAPI `app`."""
+    app = getattr(importlib.import_module("api.main"), "app", None)
+    assert isinstance(app, FastAPI), "api.main must expose a FastAPI `app`."
+    return app
+
+
+# ------------------------------
+# Fixtures
+# ------------------------------
+
+@pytest.fixture(scope="session")
+def repo_root() -> Path:
+    return _ROOT
+
+
+@pytest.fixture(scope="session")
+def app() -> FastAPI:
+    return _load_main_app()
@@ -0,0 +1,144 @@
+"""
+Config loading tests for api/core/config.py.
+
+Scope (only):
+- The opt-in STEMSPROUTS_FAST_CONFIG dataclass path must resolve APP_VERSION
+  like the default pydantic-settings path for:
+  • env vars win over .env; names are case-insensitive
+  • .env quoting, comment lines, inline comments, `export ` prefix
+  • missing .env falls back to the default
+- Known difference: escapes in double-quoted .env values are processed by
+  python-dotenv but kept verbatim on the fast path.
+"""
+from __future__ import annotations
+
+import importlib
+import os
+import subprocess
+import sys
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+import pytest
+
+
+# ------------------------------
+# Utilities
+# ------------------------------
+
+def _config_module():
+    return importlib.import_module("api.core.config")
+
+
+def _clear_caches(cfg) -> None:
+    for fn in (cfg.get_settings, cfg._build_settings_cls, cfg._dotenv):
+        fn.cache_clear()
+
+
+# ------------------------------
+# Fixtures
+# ------------------------------
+
+@pytest.fixture(params=[False, True], ids=["pydantic", "fast"])
+def load_settings(
+    request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> Iterator[Callable[[], object]]:
+    """Run each test against both config paths, from an empty working dir."""
+    cfg = _config_module()
+    monkeypatch.chdir(tmp_path)
+    for key in list(os.environ):
+        if key.lower() == "app_version":
+            monkeypatch.delenv(key)
+    monkeypatch.setattr(cfg, "FAST_CONFIG", request.param)
+
+    def load():
+        _clear_caches(cfg)
+        return cfg.get_settings()
+
+    yield load
+    _clear_caches(cfg)
+
+
+def _write_env(text: str) -> None:
+    Path(".env").write_text(text, encoding="utf-8")
+
+
+# ------------------------------
+# Precedence and lookup
+# ------------------------------
+
+def test_missing_env_file_uses_default(load_settings) -> None:
+    assert not Path(".env").exists()
+    assert load_settings().APP_VERSION == "0.0.0"
+
+
+def test_reads_env_file(load_settings) -> None:
+    _write_env("APP_VERSION=1.2.3\n")
+    assert load_settings().APP_VERSION == "1.2.3"
+
+
+def test_environment_wins_over_env_file(load_settings, monkeypatch: pytest.MonkeyPatch) -> None:
+    _write_env("APP_VERSION=1.2.3\n")
+    monkeypatch.setenv("APP_VERSION", "9.9.9")
+    assert load_settings().APP_VERSION == "9.9.9"
+
+
+def test_environment_name_is_case_insensitive(load_settings, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("app_version", "7.7.7")
+    assert load_settings().APP_VERSION == "7.7.7"
+
+
+def test_env_file_name_is_case_insensitive(load_settings) -> None:
+    _write_env("app_version=7.7.7\n")
+    assert load_settings().APP_VERSION == "7.7.7"
+
+
+# ------------------------------
+# .env syntax
+# ------------------------------
+
+@pytest.mark.parametrize(
+    ("line", "expected"),
+    [
+        ('APP_VERSION="1.2.3"', "1.2.3"),
+        ("APP_VERSION='1.2.3'", "1.2.3"),
+        ('APP_VERSION="1.2.3 # not a comment"', "1.2.3 # not a comment"),
+        ('APP_VERSION="1.2.3" # release', "1.2.3"),
+        ("APP_VERSION=1.2.3 # release", "1.2.3"),
+        ("APP_VERSION=1.2.3#build", "1.2.3#build"),
+        ("export APP_VERSION=4.5.6", "4.5.6"),
+    ],
+)
+def test_env_file_values(load_settings, line: str, expected: str) -> None:
+    _write_env(f"# comment line\n\n{line}\n")
+    assert load_settings().APP_VERSION == expected
+
+
+def test_double_quoted_escapes_differ_on_fast_path(load_settings) -> None:
+    # Pinned on purpose: the fast path does no escape processing, so it is not
+    # a drop-in for python-dotenv here.
+    _write_env('APP_VERSION="1.2\\t3"\n')
+    expected = "1.2\\t3" if _config_module().FAST_CONFIG else "1.2\t3"
+    assert load_settings().APP_VERSION == expected
+
+
+# ------------------------------
+# Flag wiring
+# ------------------------------
+
+def test_flag_selects_dataclass_without_pydantic_settings(repo_root: Path, tmp_path: Path) -> None:
+    code = (
+        "import dataclasses, sys\n"
+        "import api.core.config as cfg\n"
+        "assert cfg.FAST_CONFIG\n"
+        "assert dataclasses.is_dataclass(cfg.settings)\n"
+        "assert 'pydantic_settings' not in sys.modules\n"
+        "print(cfg.APP_VERSION)\n"
+    )
+    env = {**os.environ, "STEMSPROUTS_FAST_CONFIG": "1", "APP_VERSION": "3.1.4"}
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(repo_root), env.get("PYTHONPATH")]))
+    out = subprocess.run(
+        [sys.executable, "-c", code], cwd=tmp_path, env=env, capture_output=True, text=True
+    )
+    assert out.returncode == 0, out.stderr
+    assert out.stdout.strip() == "3.1.4"